@@ -1,9 +1,23 @@
 """Python control of NI RF Signal Generators using NI-RFSG"""
+from typing import TYPE_CHECKING
 from nirfsg.version import __version__
-from nirfsg.pxie_5654 import PXIe_5654
+
+if TYPE_CHECKING:
+    from nirfsg.pxie_5654 import PXIe_5654
 
 __all__ = ["__version__", "PXIe_5654"]
 
 
+def __getattr__(name):
+    # the instrument classes load the NI-RFSG driver, so import them on first use
+    if name == "PXIe_5654":
+        # pylint: disable-next=import-outside-toplevel
+        from nirfsg.pxie_5654 import PXIe_5654
+
+        globals()[name] = PXIe_5654
+        return PXIe_5654
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def __dir__():
     return __all__
@@ -1,15 +1,46 @@
 """NI-RFSG attributemonger"""
-from functools import wraps
+from functools import wraps, partial, lru_cache
 from pathlib import Path
 from enum import Enum
 from datetime import timedelta
-import copy
+import csv
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import zlib
 from nirfsg import c_api
 
+_TABLE_PATH = Path(__file__).parent / "attribute_table.csv"
+_CACHE_PATH = Path(__file__).parent / "__pycache__" / "attrtable.pkl"
+# bump when the layout of the parsed rows changes
+_CACHE_VERSION = 2
+# defined value names such as NIRFSG_VAL_ONBOARD_CLOCK_STR -> 'onboard clock'
+_VAL_RE = re.compile(r"^NIRFSG_VAL_(.*?)(?:_STR)?$")
+_UNDERSCORE_TT = str.maketrans("_", " ")
+# guards the first use of DefinedValues.enum/rev
+_DEFINED_VALUES_LOCK = threading.Lock()
+
 
 class Attribute:
     """Attribute"""
 
+    # table data, shared by the session bound copies
+    _table_slots = (
+        "c_api_name",
+        "id",
+        "c_type",
+        "subsystem",
+        "name",
+        "supported_models",
+        "defined_values",
+        "_get",
+        "_set",
+    )
+    __slots__ = _table_slots + ("_vi", "_channel", "_bound_get", "_bound_set")
+
     def __init__(
         self,
         c_api_name,
@@ -31,11 +62,13 @@ class Attribute:
         self._channel = None
         self._get = c_api.GETLU[c_type]
         self._set = c_api.SETLU[c_type]
+        self._bound_get = None
+        self._bound_set = None
 
     @property
     def value(self):
         """Value of the attribute"""
-        value = self._get(self._vi, self._channel, self.id)
+        value = self._bound_get()
         if self.defined_values is not None:
             value = self.defined_values(value)
         elif self.c_type == c_api.ViBoolean:
@@ -49,33 +82,120 @@ class Attribute:
     @value.setter
     def value(self, new_value):
         if self.defined_values is not None:
-            new_value = getattr(self.defined_values, new_value, new_value)
-            if hasattr(new_value, "value"):
+            new_value = self.defined_values.fwd.get(new_value, new_value)
+            if isinstance(new_value, Enum):
                 new_value = new_value.value
-        self._set(self._vi, self._channel, self.id, new_value)
+        self._bound_set(new_value)
+
+    def supports(self, model):
+        """Whether the attribute is supported by model
+
+        Parameters
+        ----------
+        model : str
+            instrument model such as 'NI PXIe-5654'
+
+        Returns
+        -------
+        bool
+        """
+        return _supports(self.supported_models, model)
+
+    def clone_bound(self, vi, channel):
+        """Create a copy of the attribute bound to a session and channel
+
+        Only the binding is per copy, the table data is shared with the template.
+
+        Parameters
+        ----------
+        vi : ViSession
+        channel : str
+
+        Returns
+        -------
+        Attribute
+        """
+        new = object.__new__(Attribute)
+        for slot in self._table_slots:
+            setattr(new, slot, getattr(self, slot))
+        new._vi = vi
+        new._channel = channel
+        new._bound_get = partial(self._get, vi, channel, self.id)
+        new._bound_set = partial(self._set, vi, channel, self.id)
+        return new
 
     def __eq__(self, other):
+        if not isinstance(other, Attribute):
+            return NotImplemented
         return self.id == other.id
 
+    def __hash__(self):
+        return hash(self.id)
 
-class SupportedModels(list):
-    """list of supported models for a given attribute
+
+class DefinedValues:
+    """Defined values of an attribute
+
+    The Enum that attribute values are returned as, `enum`, and its value to
+    member map, `rev`, are only created once a value is read, most attributes in
+    the table are never used in a session. A value that isn't defined is
+    returned as is.
 
     Parameters
     ----------
-    models : list of str
-        model names such as PXIe-5654
-
-    When the list contains 'all', a test for `in` returns True.
+    name : str
+        attribute name
+    pairs : list of (name, value)
+        such as ('onboard clock', 'OnboardClock')
     """
 
-    def __contains__(self, value):
-        if super().__contains__("all"):
-            return True
-        for model in self:
-            if model in value:
-                return True
-        return False
+    __slots__ = ("name", "fwd", "enum", "rev")
+
+    def __init__(self, name, pairs):
+        self.name = name
+        self.fwd = dict(pairs)
+
+    def __getattr__(self, item):
+        # 'enum' and 'rev' are only assigned on first use
+        if item not in ("enum", "rev"):
+            raise AttributeError(item)
+        with _DEFINED_VALUES_LOCK:
+            # only one Enum per attribute, callers key dicts by its members
+            try:
+                return object.__getattribute__(self, item)
+            except AttributeError:
+                pass
+            enum = Enum(self.name, list(self.fwd.items()))
+            rev = {member.value: member for member in enum}
+            # lazy by design, see the class docstring
+            # pylint: disable=attribute-defined-outside-init
+            self.rev = rev
+            self.enum = enum
+            # pylint: enable=attribute-defined-outside-init
+        return getattr(self, item)
+
+    def __call__(self, value):
+        return self.rev.get(value, value)
+
+
+@lru_cache(maxsize=None)
+def _supports(supported_models, model):
+    """Test whether model matches any of the supported models
+
+    Parameters
+    ----------
+    supported_models : tuple of str
+        model names such as PXIe-5654, or ('all',)
+    model : str
+        instrument model such as 'NI PXIe-5654'
+
+    Returns
+    -------
+    bool
+    """
+    if "all" in supported_models:
+        return True
+    return any(supmod in model for supmod in supported_models)
 
 
 def singleton(cls):
@@ -98,6 +218,9 @@ class AttributeMonger:
     Parameters
     ----------
     instrument_handle : ViSession
+    subsystem : str or tuple of str
+        such as 'clock' or ('model', 'channel') for several at once
+    channel : str
 
     Returns
     -------
@@ -106,54 +229,146 @@ class AttributeMonger:
 
     def __init__(self):
         self._attributes = {}
+        self._template_cache = {}
+        self._cache = {}
+        self._model_cache = {}
         self._readtable()
 
     def _readtable(self):
-        with open(Path(__file__).parent / "attribute_table.csv") as file:
-            for line in file.readlines():
-                tokens = line.strip().split(",")
-                if not tokens[0].startswith("NIRFSG") or tokens[3] == "":
+        for row in self._loadtable():
+            c_api_name, attr_id, c_type, name, subsystem, supmods, defvals = row
+            c_type = getattr(c_api, c_type)
+            subsystem = sys.intern(subsystem)
+            supmods = ("all",) if "all" in supmods else tuple(map(sys.intern, supmods))
+            defvals = DefinedValues(name, defvals) if len(defvals) > 0 else None
+            # names repeat across subsystems, e.g. start_trigger.type and
+            # configurationlist_trigger.type, so key on the C name
+            attr = Attribute(
+                c_api_name, attr_id, c_type, subsystem, name, supmods, defvals
+            )
+            self._attributes[c_api_name] = attr
+
+    @staticmethod
+    def _loadtable():
+        """Load the parsed attribute table, reusing the pickled copy if current
+
+        Only plain rows are pickled; the Enum classes for the defined values
+        are created at runtime and can't be pickled by reference. The rows are
+        stored with a checksum, so a damaged cache is read as a miss.
+        """
+        stat = _TABLE_PATH.stat()
+        key = (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(_CACHE_PATH, "rb") as file:
+                cached_key, checksum, data = pickle.load(file)
+            if cached_key == key and zlib.crc32(data) == checksum:
+                return pickle.loads(data)
+        except Exception:  # pylint: disable=broad-except
+            # a missing or damaged cache is re-created from the table
+            pass
+        rows = AttributeMonger._parsetable()
+        data = pickle.dumps(rows)
+        try:
+            _CACHE_PATH.parent.mkdir(exist_ok=True)
+            # write a temporary file and rename it, so that no other process
+            # ever reads a partly written cache
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=_CACHE_PATH.parent, suffix=".tmp", delete=False
+            ) as file:
+                pickle.dump((key, zlib.crc32(data), data), file)
+            try:
+                os.replace(file.name, _CACHE_PATH)
+            except OSError:
+                os.remove(file.name)
+                raise
+        except OSError:
+            # e.g. read-only install location
+            pass
+        return rows
+
+    @staticmethod
+    def _parsetable():
+        rows = []
+        with open(_TABLE_PATH, newline="") as file:
+            for row in csv.reader(file):
+                if not row or row[0][:6] != "NIRFSG" or row[3] == "":
                     continue
-                c_api_name = tokens[0]
-                attr_id = int(tokens[1])
-                c_type = getattr(c_api, tokens[2])
-                name = tokens[3]
-                subsystem = tokens[4]
-                i = 6
-                cnt = int(tokens[i - 1])
-                supmods = SupportedModels(tokens[i : i + cnt])
-                i = i + cnt + 1
-                cnt = int(tokens[i - 1]) if tokens[i - 1] != "" else 0
+                i = 6 + int(row[5])
+                supmods = row[6:i]
+                cnt = int(row[i]) if row[i] != "" else 0
+                pairs = row[i + 1 : i + 1 + 2 * cnt]
                 defvals = []
-                if cnt > 0:
-                    for cn, v in zip(
-                        tokens[i : i + 2 * cnt + 1 : 2],
-                        tokens[i + 1 : i + 1 + 2 * cnt : 2],
-                    ):
-                        n = (
-                            cn.split("_VAL_")[-1]
-                            .replace("_", " ")
-                            .replace(" STR", "")
-                            .lower()
-                        )
-                        v = int(v) if v.isdecimal() else v
-                        defvals.append([n, v])
-                defvals = Enum(name, defvals) if len(defvals) > 0 else None
-                self._attributes[name] = Attribute(
-                    c_api_name, attr_id, c_type, subsystem, name, supmods, defvals
+                for cn, v in zip(pairs[::2], pairs[1::2]):
+                    m = _VAL_RE.match(cn)
+                    n = (m.group(1) if m else cn).translate(_UNDERSCORE_TT).lower()
+                    v = int(v) if v.isdecimal() else v
+                    defvals.append((n, v))
+                rows.append(
+                    (row[0], int(row[1]), row[2], row[3], row[4], supmods, defvals)
                 )
+        return rows
+
+    def _templates(self, model, subsystems):
+        # the table entries only depend on model and subsystems, not the session
+        key = (model, subsystems)
+        templates = self._template_cache.get(key)
+        if templates is None:
+            templates = tuple(
+                attr
+                for attr in self._attributes.values()
+                if attr.subsystem in subsystems and attr.supports(model)
+            )
+            self._template_cache[key] = templates
+        return templates
+
+    @staticmethod
+    def _session_key(instrument_handle):
+        # ViSession instances aren't hashable
+        return getattr(instrument_handle, "value", instrument_handle)
+
+    def model(self, instrument_handle):
+        """Instrument model of the session, queried once per session
+
+        Parameters
+        ----------
+        instrument_handle : ViSession
+
+        Returns
+        -------
+        model : str
+        """
+        vi = self._session_key(instrument_handle)
+        model = self._model_cache.get(vi)
+        if model is None:
+            model = c_api.get_instrument_model(instrument_handle)
+            self._model_cache[vi] = model
+        return model
+
+    def forget(self, instrument_handle):
+        """Drop the cached model and attributes of a closed session
+
+        Parameters
+        ----------
+        instrument_handle : ViSession
+        """
+        vi = self._session_key(instrument_handle)
+        self._model_cache.pop(vi, None)
+        for key in [key for key in self._cache if key[0] == vi]:
+            del self._cache[key]
 
     def __call__(self, instrument_handle, subsystem, channel=""):
-        model = c_api.get_attribute_string(
-            instrument_handle, "", c_api.NIRFSG_ATTR_INSTRUMENT_MODEL
-        )
-        attrs = {}
-        for name, attr in self._attributes.items():
-            if model in attr.supported_models and subsystem == attr.subsystem:
-                attr._vi = instrument_handle
-                attr._channel = channel
-                attrs[name] = attr
-        return copy.deepcopy(attrs)
+        subsystems = (subsystem,) if isinstance(subsystem, str) else tuple(subsystem)
+        key = (self._session_key(instrument_handle), subsystems, channel)
+        attrs = self._cache.get(key)
+        if attrs is None:
+            templates = self._templates(self.model(instrument_handle), subsystems)
+            attrs = {
+                attr.name: attr.clone_bound(instrument_handle, channel)
+                for attr in templates
+            }
+            self._cache[key] = attrs
+        # each caller gets its own dict to add to
+        return dict(attrs)
 
 
 get_attributes = AttributeMonger()
@@ -1,7 +1,10 @@
 """Python binding to NI-RFSG"""
+import asyncio
 import os
 import sys
 import pathlib
+import struct
+import threading
 from functools import wraps
 from ctypes import (
     c_int16,
@@ -33,7 +36,11 @@ nirfsgdll = cdll.LoadLibrary(str(dllpath))
 def c_api(*args):
     """Decorator to retrieve the c-function from the dll
 
-    Assigns the c-function to the 'call' attribute of the decorated Python function.
+    Assigns the c-function to the 'call' attribute of the decorated Python function
+    and, if the Python function has a keyword-only argument `_c`, as its default.
+    The Python functions call the c-function through `_c`, a local, instead of an
+    attribute lookup on a global. The Python function itself is returned, so
+    calling it doesn't go through an extra forwarding frame.
 
     Parameters
     ----------
@@ -56,13 +63,11 @@ def c_api(*args):
         c_function.argtypes = argtypes
         if restype is not None:
             c_function.restype = restype
-
-        @wraps(py_function)
-        def inner(*args, **kwargs):
-            return py_function(*args, **kwargs)
-
-        inner.call = c_function
-        return inner
+        py_function.call = c_function
+        kwdefaults = py_function.__kwdefaults__
+        if kwdefaults is not None and "_c" in kwdefaults:
+            py_function.__kwdefaults__ = {**kwdefaults, "_c": c_function}
+        return py_function
 
     return outer
 
@@ -92,16 +97,52 @@ NIRFSG_ATTR_POWER_LEVEL = 1250002  # ViReal64
 NIRFSG_ATTR_OUTPUT_ENABLED = 1250004  # ViBoolean
 
 
+class _Scratch(threading.local):
+    """Per-thread output buffers reused by the get_attribute functions"""
+
+    def __init__(self):
+        super().__init__()
+        self.f64 = ViReal64()
+        self.i32 = ViInt32()
+        self.i64 = ViInt64()
+        self.b = ViBoolean()
+        self.strbuf = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
+
+
+_scratch = _Scratch()
+
+
 class niRFSGError(Exception):
     """Exception raised upon error in NI-RFSG"""
 
 
+# channel names are a small fixed set, mostly ""
+_CHAN_CACHE = {}
+
+
+def _enc_chan(channel):
+    """Encode channel name for the ViConstString argument
+
+    Parameters
+    ----------
+    channel : str
+
+    Returns
+    -------
+    channel : bytes
+    """
+    enc = _CHAN_CACHE.get(channel)
+    if enc is None:
+        enc = _CHAN_CACHE.setdefault(channel, channel.encode())
+    return enc
+
+
 @c_api(
     "niRFSG_GetError",
     (ViSession, POINTER(ViStatus), ViInt32, c_char_p),
     ViStatus,
 )
-def get_error(instrument_handle, error):
+def get_error(instrument_handle, error, *, _c=None):
     """Get error info from error code
 
     Parameters
@@ -115,7 +156,7 @@ def get_error(instrument_handle, error):
     """
     error = ViStatus(error)
     err_buf = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
-    err = get_error.call(instrument_handle, byref(error), IVI_MAX_MESSAGE_LEN, err_buf)
+    err = _c(instrument_handle, byref(error), IVI_MAX_MESSAGE_LEN, err_buf)
     if err != 0:
         raise niRFSGError(f"{err}")
     return err_buf.value.decode()
@@ -126,24 +167,20 @@ def check_error(func):
 
     @wraps(func)
     def inner(*args, **kwargs):
-        # result is always a list of at least [error_code]
-        result = func(*args, **kwargs)
-        err = result.pop()
+        # result is always a tuple of (value, error_code), value is None if
+        # the function doesn't return anything
+        result, err = func(*args, **kwargs)
         if err:
             # assuming instrument_handle is arg[0]
             err_msg = get_error(args[0], err)
             raise niRFSGError(err_msg)
-        if (n := len(result)) == 0:
-            result = None
-        elif n == 1:
-            result = result[0]
         return result
 
     return inner
 
 
 @c_api("niRFSG_init", (ViRsrc, ViBoolean, ViBoolean, POINTER(ViSession)), ViStatus)
-def init(resource_name, query_id=True, reset_device=False):
+def init(resource_name, query_id=True, reset_device=False, *, _c=None):
     """Initialize a session
 
     Parameters
@@ -161,7 +198,7 @@ def init(resource_name, query_id=True, reset_device=False):
     """
     resource_name = resource_name.encode()
     instrument_handle = ViSession(0)
-    err = init.call(resource_name, query_id, reset_device, byref(instrument_handle))
+    err = _c(resource_name, query_id, reset_device, byref(instrument_handle))
     if err:
         err_msg = get_error(ViSession(0), err)
         raise niRFSGError(f"{err_msg}")
@@ -173,7 +210,9 @@ def init(resource_name, query_id=True, reset_device=False):
     (ViRsrc, ViBoolean, ViBoolean, c_char_p, POINTER(ViSession)),
     ViStatus,
 )
-def init_withoptions(resource_name, query_id=True, reset_device=False, options=""):
+def init_withoptions(
+    resource_name, query_id=True, reset_device=False, options="", *, _c=None
+):
     """Initialize a session with options
 
     Parameters
@@ -194,9 +233,7 @@ def init_withoptions(resource_name, query_id=True, reset_device=False, options="
     resource_name = resource_name.encode()
     instrument_handle = ViSession(0)
     options = options.encode()
-    err = init_withoptions.call(
-        resource_name, query_id, reset_device, options, byref(instrument_handle)
-    )
+    err = _c(resource_name, query_id, reset_device, options, byref(instrument_handle))
     if err:
         err_msg = get_error(ViSession(0), err)
         raise niRFSGError(f"{err_msg}")
@@ -205,20 +242,20 @@ def init_withoptions(resource_name, query_id=True, reset_device=False, options="
 
 @check_error
 @c_api("niRFSG_close", (ViSession,), ViStatus)
-def close(instrument_handle):
+def close(instrument_handle, *, _c=None):
     """Close session
 
     Parameters
     ----------
     instrument_session : ViSession
     """
-    err = close.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_ConfigureRF", (ViSession, ViReal64, ViReal64), ViStatus)
-def configure_rf(instrument_handle, frequency, power):
+def configure_rf(instrument_handle, frequency, power, *, _c=None):
     """Configure basic RF attributes
 
     Parameters
@@ -227,34 +264,34 @@ def configure_rf(instrument_handle, frequency, power):
     frequency : float in hertz
     power : float in decibel_milliwatt
     """
-    err = configure_rf.call(instrument_handle, frequency, power)
-    return [err]
+    err = _c(instrument_handle, frequency, power)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_Initiate", (ViSession,), ViStatus)
-def initiate(instrument_handle):
+def initiate(instrument_handle, *, _c=None):
     """Initiate generation
 
     Parameters
     ----------
     instrument_handle : ViSession
     """
-    err = initiate.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_Abort", (ViSession,), ViStatus)
-def abort(instrument_handle):
+def abort(instrument_handle, *, _c=None):
     """Stop generation
 
     Parameters
     ----------
     instrument_handle : ViSession
     """
-    err = abort.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
@@ -263,7 +300,7 @@ def abort(instrument_handle):
     (ViSession, *map(POINTER, [ViInt32] * 6)),
     ViStatus,
 )
-def get_lastexternalcaldatetime(instrument_handle):
+def get_lastexternalcaldatetime(instrument_handle, *, _c=None):
     """Get the date and time of the last external calibration
 
     Parameters
@@ -275,9 +312,9 @@ def get_lastexternalcaldatetime(instrument_handle):
     datetime.datetime
     """
     values = [ViInt32() for _ in range(6)]
-    err = get_lastexternalcaldatetime.call(instrument_handle, *map(byref, values))
+    err = _c(instrument_handle, *map(byref, values))
     values = [v.value for v in values]
-    return [datetime(*values), err]
+    return datetime(*values), err
 
 
 @check_error
@@ -286,7 +323,7 @@ def get_lastexternalcaldatetime(instrument_handle):
     (ViSession, ViConstString, ViAttr, pViReal64),
     ViStatus,
 )
-def get_attribute_float(instrument_handle, channel, viattr):
+def get_attribute_float(instrument_handle, channel, viattr, *, _c=None):
     """Get float attribute for given channel
 
     Parameters
@@ -299,10 +336,10 @@ def get_attribute_float(instrument_handle, channel, viattr):
     -------
     value : float
     """
-    channel = ViConstString(channel.encode())
-    value = ViReal64()
-    err = get_attribute_float.call(instrument_handle, channel, viattr, byref(value))
-    return [value.value, err]
+    channel = _enc_chan(channel)
+    value = _scratch.f64
+    err = _c(instrument_handle, channel, viattr, byref(value))
+    return value.value, err
 
 
 @check_error
@@ -311,7 +348,7 @@ def get_attribute_float(instrument_handle, channel, viattr):
     (ViSession, c_char_p, ViAttr, ViInt32, c_char_p),
     ViStatus,
 )
-def get_attribute_string(instrument_handle, channel, viattr):
+def get_attribute_string(instrument_handle, channel, viattr, *, _c=None):
     """Get string attribute for given channel
 
     Parameters
@@ -324,19 +361,18 @@ def get_attribute_string(instrument_handle, channel, viattr):
     -------
     value : float
     """
-    channel = ViConstString(channel.encode())
-    value = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
-    err = get_attribute_string.call(
-        instrument_handle, channel, viattr, IVI_MAX_MESSAGE_BUF_SIZE, value
-    )
-    return [value.value.decode(), err]
+    channel = _enc_chan(channel)
+    value = _scratch.strbuf
+    value[0] = b"\0"
+    err = _c(instrument_handle, channel, viattr, IVI_MAX_MESSAGE_BUF_SIZE, value)
+    return value.value.decode(), err
 
 
 @check_error
 @c_api(
     "niRFSG_GetAttributeViBoolean", (ViSession, c_char_p, ViAttr, pViBoolean), ViStatus
 )
-def get_attribute_bool(instrument_handle, channel, viattr):
+def get_attribute_bool(instrument_handle, channel, viattr, *, _c=None):
     """Get the boolean attribute for given channel
 
     Parameters
@@ -349,15 +385,15 @@ def get_attribute_bool(instrument_handle, channel, viattr):
     -------
     value : bool
     """
-    channel = ViConstString(channel.encode())
-    value = ViBoolean()
-    err = get_attribute_bool.call(instrument_handle, channel, viattr, byref(value))
-    return [value.value, err]
+    channel = _enc_chan(channel)
+    value = _scratch.b
+    err = _c(instrument_handle, channel, viattr, byref(value))
+    return value.value, err
 
 
 @check_error
 @c_api("niRFSG_GetAttributeViInt32", (ViSession, c_char_p, ViAttr, pViInt32), ViStatus)
-def get_attribute_int32(instrument_handle, channel, viattr):
+def get_attribute_int32(instrument_handle, channel, viattr, *, _c=None):
     """Get the integer attribute for given channel
 
     Parameters
@@ -370,15 +406,15 @@ def get_attribute_int32(instrument_handle, channel, viattr):
     -------
     value : int
     """
-    channel = ViConstString(channel.encode())
-    value = ViInt32()
-    err = get_attribute_int32.call(instrument_handle, channel, viattr, byref(value))
-    return [value.value, err]
+    channel = _enc_chan(channel)
+    value = _scratch.i32
+    err = _c(instrument_handle, channel, viattr, byref(value))
+    return value.value, err
 
 
 @check_error
 @c_api("niRFSG_GetAttributeViInt64", (ViSession, c_char_p, ViAttr, pViInt64), ViStatus)
-def get_attribute_int64(instrument_handle, channel, viattr):
+def get_attribute_int64(instrument_handle, channel, viattr, *, _c=None):
     """Get the integer attribute for given channel
 
     Parameters
@@ -391,10 +427,10 @@ def get_attribute_int64(instrument_handle, channel, viattr):
     -------
     value : int
     """
-    channel = ViConstString(channel.encode())
-    value = ViInt64()
-    err = get_attribute_int64.call(instrument_handle, channel, viattr, byref(value))
-    return [value.value, err]
+    channel = _enc_chan(channel)
+    value = _scratch.i64
+    err = _c(instrument_handle, channel, viattr, byref(value))
+    return value.value, err
 
 
 def get_instrument_model(instrument_handle):
@@ -417,7 +453,7 @@ def get_instrument_model(instrument_handle):
     (ViSession, ViConstString, ViAttr, ViReal64),
     ViStatus,
 )
-def set_attribute_float(instrument_handle, channel, viattr, value):
+def set_attribute_float(instrument_handle, channel, viattr, value, *, _c=None):
     """Set float attribute for given channel
 
     Parameters
@@ -427,9 +463,9 @@ def set_attribute_float(instrument_handle, channel, viattr, value):
     viattr : ViAttr
     value : float
     """
-    channel = ViConstString(channel.encode())
-    err = set_attribute_float.call(instrument_handle, channel, viattr, value)
-    return [err]
+    channel = _enc_chan(channel)
+    err = _c(instrument_handle, channel, viattr, value)
+    return None, err
 
 
 @check_error
@@ -438,7 +474,7 @@ def set_attribute_float(instrument_handle, channel, viattr, value):
     (ViSession, c_char_p, ViAttr, c_char_p),
     ViStatus,
 )
-def set_attribute_string(instrument_handle, channel, viattr, value):
+def set_attribute_string(instrument_handle, channel, viattr, value, *, _c=None):
     """Set string attribute for given channel
 
     Parameters
@@ -448,17 +484,17 @@ def set_attribute_string(instrument_handle, channel, viattr, value):
     viattr : ViAttr
     value : str
     """
-    channel = ViConstString(channel.encode())
+    channel = _enc_chan(channel)
     value = ViConstString(value.encode())
-    err = set_attribute_string.call(instrument_handle, channel, viattr, value)
-    return [err]
+    err = _c(instrument_handle, channel, viattr, value)
+    return None, err
 
 
 @check_error
 @c_api(
     "niRFSG_SetAttributeViBoolean", (ViSession, c_char_p, ViAttr, ViBoolean), ViStatus
 )
-def set_attribute_bool(instrument_handle, channel, viattr, value):
+def set_attribute_bool(instrument_handle, channel, viattr, value, *, _c=None):
     """Set the boolean attribute for given channel
 
     Parameters
@@ -468,14 +504,14 @@ def set_attribute_bool(instrument_handle, channel, viattr, value):
     viattr : ViAttr
     value : bool
     """
-    channel = ViConstString(channel.encode())
-    err = set_attribute_bool.call(instrument_handle, channel, viattr, value)
-    return [err]
+    channel = _enc_chan(channel)
+    err = _c(instrument_handle, channel, viattr, value)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_SetAttributeViInt32", (ViSession, c_char_p, ViAttr, ViInt32), ViStatus)
-def set_attribute_int32(instrument_handle, channel, viattr, value):
+def set_attribute_int32(instrument_handle, channel, viattr, value, *, _c=None):
     """Set the integer attribute for given channel
 
     Parameters
@@ -485,14 +521,14 @@ def set_attribute_int32(instrument_handle, channel, viattr, value):
     viattr : ViAttr
     value : int
     """
-    channel = ViConstString(channel.encode())
-    err = set_attribute_int32.call(instrument_handle, channel, viattr, value)
-    return [err]
+    channel = _enc_chan(channel)
+    err = _c(instrument_handle, channel, viattr, value)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_SetAttributeViInt64", (ViSession, c_char_p, ViAttr, ViInt64), ViStatus)
-def set_attribute_int64(instrument_handle, channel, viattr, value):
+def set_attribute_int64(instrument_handle, channel, viattr, value, *, _c=None):
     """Set the integer attribute for given channel
 
     Parameters
@@ -502,9 +538,9 @@ def set_attribute_int64(instrument_handle, channel, viattr, value):
     viattr : ViAttr
     value : int
     """
-    channel = ViConstString(channel.encode())
-    err = set_attribute_int32.call(instrument_handle, channel, viattr, value)
-    return [err]
+    channel = _enc_chan(channel)
+    err = _c(instrument_handle, channel, viattr, value)
+    return None, err
 
 
 GETLU = {
@@ -524,8 +560,8 @@ SETLU = {
 
 
 @check_error
-@c_api("niRFSG_GetChannelName", (ViSession, ViInt32, ViInt32, c_char_p))
-def get_channelname(instrument_handle, index):
+@c_api("niRFSG_GetChannelName", (ViSession, ViInt32, ViInt32, c_char_p), ViStatus)
+def get_channelname(instrument_handle, index, *, _c=None):
     """Get channel name for index
 
     Parameters
@@ -538,13 +574,13 @@ def get_channelname(instrument_handle, index):
     name : str
     """
     name = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
-    err = get_channelname.call(instrument_handle, index, IVI_MAX_MESSAGE_LEN, name)
-    return [name.value.decode(), err]
+    err = _c(instrument_handle, index, IVI_MAX_MESSAGE_LEN, name)
+    return name.value.decode(), err
 
 
 @check_error
 @c_api("niRFSG_CheckGenerationStatus", (ViSession, POINTER(ViBoolean)), ViStatus)
-def check_generationstatus(instrument_handle):
+def check_generationstatus(instrument_handle, *, _c=None):
     """Check the generation status
 
     Parameters
@@ -556,13 +592,13 @@ def check_generationstatus(instrument_handle):
     isdone : bool
     """
     isdone = ViBoolean()
-    err = check_generationstatus.call(instrument_handle, byref(isdone))
-    return [bool(isdone.value), err]
+    err = _c(instrument_handle, byref(isdone))
+    return bool(isdone.value), err
 
 
 @check_error
 @c_api("niRFSG_revision_query", (ViSession, c_char_p, c_char_p), ViStatus)
-def get_revisions(instrument_handle):
+def get_revisions(instrument_handle, *, _c=None):
     """Get RFSG driver revision and device firmware revision
 
     Parameters
@@ -576,42 +612,84 @@ def get_revisions(instrument_handle):
     """
     driver_revision = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
     firmware_revision = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
-    err = get_revisions.call(instrument_handle, driver_revision, firmware_revision)
+    err = _c(instrument_handle, driver_revision, firmware_revision)
     driver_revision = driver_revision.value.decode()
     firmware_revision = firmware_revision.value.decode()
-    return [driver_revision, firmware_revision, err]
+    return (driver_revision, firmware_revision), err
 
 
 @check_error
 @c_api("niRFSG_Commit", (ViSession,), ViStatus)
-def commit(instrument_handle):
+def commit(instrument_handle, *, _c=None):
     """Commit session
 
     Parameters
     ----------
     instrument_handle : ViSession
     """
-    err = commit.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_WaitUntilSettled", (ViSession, ViInt32), ViStatus)
-def waituntilsettled(instrument_handle, maxwait=10000):
+def waituntilsettled(instrument_handle, maxwait=10000, *, _c=None):
     """Wait until settled
 
+    Notes
+    -----
+    ctypes releases the GIL while the driver waits, so other Python threads keep
+    running. Use `awaituntilsettled` from asyncio code.
+
+    Parameters
+    ----------
+    instrument_handle : ViSession
+    maxwait : int in millisecond
+    """
+    err = _c(instrument_handle, maxwait)
+    return None, err
+
+
+async def awaituntilsettled(instrument_handle, maxwait=10000):
+    """Wait until settled without blocking the event loop
+
+    Runs `waituntilsettled` in a worker thread.
+
     Parameters
     ----------
     instrument_handle : ViSession
     maxwait : int in millisecond
     """
-    err = waituntilsettled.call(instrument_handle, maxwait)
-    return [err]
+    await asyncio.to_thread(waituntilsettled, instrument_handle, maxwait)
+
+
+async def ainitiate(instrument_handle):
+    """Initiate generation without blocking the event loop
+
+    Runs `initiate` in a worker thread.
+
+    Parameters
+    ----------
+    instrument_handle : ViSession
+    """
+    await asyncio.to_thread(initiate, instrument_handle)
+
+
+async def aabort(instrument_handle):
+    """Stop generation without blocking the event loop
+
+    Runs `abort` in a worker thread.
+
+    Parameters
+    ----------
+    instrument_handle : ViSession
+    """
+    await asyncio.to_thread(abort, instrument_handle)
 
 
 @check_error
 @c_api("niRFSG_ConfigureOutputEnabled", (ViSession, ViBoolean), ViStatus)
-def set_outputenabled(instrument_handle, value=False):
+def set_outputenabled(instrument_handle, value=False, *, _c=None):
     """Set output enabled state
 
     Parameters
@@ -620,13 +698,13 @@ def set_outputenabled(instrument_handle, value=False):
     value : bool
         If True, output is enabled, else output is disabled
     """
-    err = set_outputenabled.call(instrument_handle, value)
-    return [err]
+    err = _c(instrument_handle, value)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_reset", (ViSession,), ViStatus)
-def reset(instrument_handle):
+def reset(instrument_handle, *, _c=None):
     """Reset all properties to their default values
 
     Also, move the NI-RFSG device to the Configuration state.
@@ -640,13 +718,13 @@ def reset(instrument_handle):
     ----------
     instrument_handle : ViSession
     """
-    err = reset.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_reset", (ViSession,), ViStatus)
-def resetdevice(instrument_handle):
+def resetdevice(instrument_handle, *, _c=None):
     """Perform a hard reset on the device
 
     Notes
@@ -658,8 +736,8 @@ def resetdevice(instrument_handle):
     ----------
     instrument_handle : ViSession
     """
-    err = reset.call(instrument_handle)
-    return [err]
+    err = _c(instrument_handle)
+    return None, err
 
 
 @check_error
@@ -668,7 +746,7 @@ def resetdevice(instrument_handle):
     (ViSession, ViConstString, ViInt32, pViAttr, ViBoolean),
     ViStatus,
 )
-def create_configurationlist(instrument_handle, name, attributes):
+def create_configurationlist(instrument_handle, name, attributes, *, _c=None):
     """Create a new configuration list and set as active list
 
     Parameters
@@ -678,29 +756,28 @@ def create_configurationlist(instrument_handle, name, attributes):
     attributes : List[ViAttr]
     """
     name = ViConstString(name.encode())
-    attrarraytype = ViAttr * len(attributes)
-    attrarray = attrarraytype(*attributes)
-    err = create_configurationlist.call(
-        instrument_handle, name, len(attributes), attrarray, True
-    )
-    return [err]
+    # pack in C rather than converting each element through ctypes
+    buf = struct.pack(f"{len(attributes)}I", *attributes)
+    attrarray = (ViAttr * len(attributes)).from_buffer_copy(buf)
+    err = _c(instrument_handle, name, len(attributes), attrarray, True)
+    return None, err
 
 
 @check_error
 @c_api("niRFSG_CreateConfigurationListStep", (ViSession, ViBoolean), ViStatus)
-def create_configurationlist_step(instrument_handle):
+def create_configurationlist_step(instrument_handle, *, _c=None):
     """Create a new step and set as active step
 
     Parameters
     ----------
     instrument_handle : ViSession
     """
-    err = create_configurationlist_step.call(instrument_handle, True)
-    return [err]
+    err = _c(instrument_handle, True)
+    return None, err
 
 @check_error
 @c_api("niRFSG_self_test", (ViSession, pViInt16, ViString), ViStatus)
-def self_test(instrument_handle):
+def self_test(instrument_handle, *, _c=None):
     """Self test
     
     Parameters
@@ -709,10 +786,10 @@ def self_test(instrument_handle):
 
     Returns
     -------
-    list [result : bool, message : str]
+    tuple (result : bool, message : str)
     """
     result = ViInt16()
     message = create_string_buffer(IVI_MAX_MESSAGE_BUF_SIZE)
-    err = self_test.call(instrument_handle, byref(result), message)
+    err = _c(instrument_handle, byref(result), message)
     message = message.value.decode()
-    return [bool(result), message, err]
+    return (bool(result), message), err
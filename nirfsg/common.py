@@ -12,6 +12,9 @@ class niBase(ABC):
     instrument_handle : ViSession
     """
 
+    # class level fallback so `_attrs` is always found, even before __init__
+    _attrs = {}
+
     @abstractmethod
     def __init__(self, instrument_handle):
         self._vi = instrument_handle
@@ -25,25 +28,25 @@ class niBase(ABC):
         inst_attr = list(filter(self._ispublic, self.__dict__))
         cls_attr = list(filter(self._ispublic, dir(self.__class__)))
         ni_attr = list(filter(self._ispublic, self._attrs))
-        return inst_attr + cls_attr + ni_attr
+        # cached properties are in both the instance and the class dict
+        return list(dict.fromkeys(inst_attr + cls_attr + ni_attr))
+
+    def __contains__(self, item):
+        return item in self._attrs
 
     def __getattr__(self, item):
-        if item in self._attrs:
-            attr = self._attrs[item]
+        # only reached when item isn't an instance or class attribute
+        attr = self._attrs.get(item)
+        if attr is not None:
             return attr.value
-        return self.__dict__.get(item, None)
+        return None
 
     def __setattr__(self, item, value):
-        try:
-            attrs = super().__getattribute__("_attrs")
-        except AttributeError:
-            super().__setattr__(item, value)
+        attr = self._attrs.get(item)
+        if attr is not None:
+            attr.value = value
         else:
-            if item in attrs:
-                attr = attrs[item]
-                attr.value = value
-            else:
-                super().__setattr__(item, value)
+            super().__setattr__(item, value)
 
     @abstractmethod
     def __repr__(self):
@@ -71,6 +74,56 @@ class Subsystem(niBase):
         return f"<{self._owner} Subsystem:{self._kind}>"
 
 
+class AttributeBatch:
+    """Context manager that defers attribute writes of a signal generator
+
+    Writes are collected while the batch is active and sent at exit. When both
+    'rf_frequency' and 'rf_power' are written, they are sent with a single
+    `configure_rf` call. Reads during the batch return the instrument's current
+    values. Nothing is written if the block raises an exception.
+
+    Parameters
+    ----------
+    owner : SignalGenerator
+    """
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._pending = {}
+
+    def add(self, item, value):
+        """Defer writing value to attribute item
+
+        Parameters
+        ----------
+        item : str
+        value : attribute value
+        """
+        self._pending[item] = value
+
+    def __enter__(self):
+        # a nested batch leaves its writes to the outer batch
+        if self._owner._batch is None:
+            self._owner._batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._owner._batch is not self:
+            return
+        self._owner._batch = None
+        # start empty if the batch is used again, whether or not this block raised
+        pending, self._pending = self._pending, {}
+        if exc_type is not None:
+            return
+        if "rf_frequency" in pending and "rf_power" in pending:
+            frequency = pending.pop("rf_frequency")
+            power = pending.pop("rf_power")
+            self._owner.configure_rf(frequency, power)
+        attrs = self._owner._attrs
+        for item, value in pending.items():
+            attrs[item].value = value
+
+
 class SignalGenerator(niBase):
     """Base class for signal generators
 
@@ -87,6 +140,8 @@ class SignalGenerator(niBase):
     SignalGenerator
     """
 
+    _batch = None
+
     def __init__(self, resource_name, reset_device=False, driver_options=""):
         if driver_options == "":
             vi = c_api.init(resource_name, reset_device=reset_device)
@@ -95,16 +150,39 @@ class SignalGenerator(niBase):
                 resource_name, reset_device=reset_device, options=driver_options
             )
         super().__init__(vi)
+        # the model can't change during a session
+        self._model = get_attributes.model(vi)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        c_api.close(self._vi)
+        self.close()
+
+    def __setattr__(self, item, value):
+        batch = self._batch
+        if batch is not None and item in self._attrs:
+            batch.add(item, value)
+        else:
+            super().__setattr__(item, value)
+
+    def batch(self):
+        """Collect attribute writes and send them at the end of a with block
+
+        Example
+        -------
+        > with sig_gen.batch():
+            sig_gen.rf_frequency = 1e9
+            sig_gen.rf_power = -10
+
+        Returns
+        -------
+        AttributeBatch
+        """
+        return AttributeBatch(self)
 
     def __repr__(self):
-        modelstr = c_api.get_instrument_model(self._vi)
-        return f"<{modelstr}>"
+        return f"<{self._model}>"
 
     @abstractmethod
     def configure_rf(self, frequency, power):
@@ -136,10 +214,26 @@ class SignalGenerator(niBase):
     def close(self):
         """Stop signal generation and close driver session"""
         c_api.close(self._vi)
+        get_attributes.forget(self._vi)
 
     def wait_until_settled(self):
         """Wait unit output is settled to new frequency/power setting"""
         c_api.waituntilsettled(self._vi)
+
+    async def ainitiate(self):
+        """Initiate signal generation from asyncio code"""
+        await c_api.ainitiate(self._vi)
+
+    async def aabort(self):
+        """Stop signal generation from asyncio code"""
+        await c_api.aabort(self._vi)
+
+    async def await_until_settled(self):
+        """Wait until output is settled from asyncio code
+
+        Several instruments can settle concurrently, e.g. with asyncio.gather.
+        """
+        await c_api.awaituntilsettled(self._vi)
     
     def self_test(self):
         """Perform niRFSG self test
@@ -150,7 +244,7 @@ class SignalGenerator(niBase):
             result = 0 indicates that the device is powered-up and responding
             result = 1 indicates a self test failure
         """
-        return tuple(c_api.self_test(self._vi))
+        return c_api.self_test(self._vi)
 
 
 class ConfigurationList(Subsystem, kind="configuration_list"):
@@ -194,27 +288,37 @@ class StartTrigger(Subsystem, kind="start_trigger"):
     owner : niBase
     """
 
+    # attributes hidden from dir() for each trigger type
+    _dir_exclude_attrs = {
+        "none": ("edge", "source"),
+        "digital edge": ("software",),
+        "software": ("edge", "source"),
+    }
+
     def __init__(self, owner):
         super().__init__(owner)
         self._attrs = get_attributes(self._vi, subsystem=self._kind)
+        # keyed by the type enum members, so dir() can look up the type as read
+        trigtypes = self._attrs["type"].defined_values.enum
+        self._dir_exclude = {
+            trigtypes[trigtype]: frozenset(attrs)
+            for trigtype, attrs in self._dir_exclude_attrs.items()
+        }
+        self._trigtype = None
+
+    def __setattr__(self, item, value):
+        super().__setattr__(item, value)
+        if item == "type":
+            # read the new trigger type on the next dir()
+            self._trigtype = None
 
     def __dir__(self):
-        attrs = super().__dir__()
-        trigtype = self.type
-        trigtype_enum = type(trigtype)
-        if trigtype == getattr(trigtype_enum, "none"):
-            if "edge" in attrs:
-                attrs.remove("edge")
-            if "source" in attrs:
-                attrs.remove("source")
-        elif trigtype == getattr(trigtype_enum, "digital edge"):
-            if "software" in attrs:
-                attrs.remove("software")
-        elif trigtype == getattr(trigtype_enum, "software"):
-            if "digital edge" in attrs:
-                attrs.remove("edge")
-                attrs.remove("source")
-        return attrs
+        trigtype = self._trigtype
+        if trigtype is None:
+            trigtype = self.type
+            self._trigtype = trigtype
+        excluded = self._dir_exclude.get(trigtype, frozenset())
+        return [attr for attr in super().__dir__() if attr not in excluded]
 
 
 class ConfigurationListTrigger(Subsystem, kind="configurationlist_trigger"):
@@ -1,4 +1,5 @@
 """PXIe-5654 20 GHz analog signal generator"""
+from functools import cached_property
 import nirfsg.c_api as c_api
 from nirfsg.common import (
     SignalGenerator,
@@ -31,15 +32,40 @@ class PXIe_5654(SignalGenerator):
 
     def __init__(self, resource_name, reset_device=False, driver_options=""):
         super().__init__(resource_name, reset_device, driver_options)
-        self._attrs = get_attributes(self._vi, subsystem="model")
-        self._attrs.update(get_attributes(self._vi, subsystem="channel"))
+        self._attrs = get_attributes(self._vi, subsystem=("model", "channel"))
         self._channel = ""
-        self.modulation = AnalogModulation(self)
-        self.clock = RefClock(self)
-        self.configurationlist = ConfigurationList(self)
-        self.triggers = Triggers(self)
-        self.events = Events(self)
-        self.external_cal = ExternalCalibration(self)
+
+    # subsystems are created on first access
+
+    @cached_property
+    def modulation(self):
+        """Analog modulation subsystem"""
+        return AnalogModulation(self)
+
+    @cached_property
+    def clock(self):
+        """Reference clock subsystem"""
+        return RefClock(self)
+
+    @cached_property
+    def configurationlist(self):
+        """Configuration list subsystem"""
+        return ConfigurationList(self)
+
+    @cached_property
+    def triggers(self):
+        """Triggers subsystem"""
+        return Triggers(self)
+
+    @cached_property
+    def events(self):
+        """Events subsystem"""
+        return Events(self)
+
+    @cached_property
+    def external_cal(self):
+        """External calibration subsystem"""
+        return ExternalCalibration(self)
 
     def configure_rf(self, frequency, power):
         """Configure RF frequency and power
@@ -60,36 +86,29 @@ class AnalogModulation(Subsystem, kind="analog_modulation"):
     owner : niBase
     """
 
+    # attribute name prefixes hidden from dir() for each modulation mode
+    _dir_exclude_prefixes = {
+        "none": ("am", "fm", "pm"),
+        "am": ("fm", "pm"),
+        "fm": ("am", "pm"),
+        "pm": ("am", "fm"),
+    }
+
     def __init__(self, owner):
         super().__init__(owner)
         self._attrs = get_attributes(self._vi, subsystem=self._kind)
+        # keyed by the mode enum members, so dir() can look up the mode as read
+        modes = self._attrs["mode"].defined_values.enum
+        self._dir_exclude = {
+            modes[mode]: frozenset(
+                attr for attr in self._attrs if attr.startswith(prefixes)
+            )
+            for mode, prefixes in self._dir_exclude_prefixes.items()
+        }
 
     def __dir__(self):
-        attrs = super().__dir__()
-        mode = self.mode
-        mode_enum = type(mode)
-        attrs_copy = attrs.copy()
-        if mode == getattr(mode_enum, "none"):
-            for attr in attrs_copy:
-                if (
-                    attr.startswith("am")
-                    or attr.startswith("fm")
-                    or attr.startswith("pm")
-                ):
-                    attrs.remove(attr)
-        elif mode == getattr(mode_enum, "am"):
-            for attr in attrs_copy:
-                if attr.startswith("fm") or attr.startswith("pm"):
-                    attrs.remove(attr)
-        elif mode == getattr(mode_enum, "fm"):
-            for attr in attrs_copy:
-                if attr.startswith("am") or attr.startswith("pm"):
-                    attrs.remove(attr)
-        elif mode == getattr(mode_enum, "pm"):
-            for attr in attrs_copy:
-                if attr.startswith("am") or attr.startswith("fm"):
-                    attrs.remove(attr)
-        return attrs
+        excluded = self._dir_exclude.get(self.mode, frozenset())
+        return [attr for attr in super().__dir__() if attr not in excluded]
 
 
 class RefClock(Subsystem, kind="clock"):
@@ -113,17 +132,19 @@ class Triggers(Subsystem, kind="triggers"):
     owner : niBase
     """
 
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.start_trigger = StartTrigger5654(self)
-        self.configurationlist_trigger = ConfigurationListTrigger(self)
+    @cached_property
+    def start_trigger(self):
+        """Start trigger subsystem"""
+        return StartTrigger5654(self)
+
+    @cached_property
+    def configurationlist_trigger(self):
+        """Configuration list trigger subsystem"""
+        return ConfigurationListTrigger(self)
 
 
 class StartTrigger5654(StartTrigger, kind="start_trigger"):
     """Start trigger for PXIe-5654"""
 
     def __dir__(self):
-        attrs = super().__dir__()
-        if "software" in attrs:
-            attrs.remove("software")
-        return attrs
+        return [attr for attr in super().__dir__() if attr != "software"]
@@ -1,5 +1,14 @@
 """Test c_api"""
-from nirfsg.c_api import init_withoptions, get_revisions, close
+import asyncio
+from nirfsg.c_api import (
+    init_withoptions,
+    get_revisions,
+    close,
+    check_generationstatus,
+    ainitiate,
+    aabort,
+    awaituntilsettled,
+)
 
 # pylint: disable=missing-function-docstring
 def test_initwithoptions():
@@ -8,3 +17,15 @@ def test_initwithoptions():
     close(vi)
     assert driver_rev.startswith("Driver: NI-RFSG")
     assert firmware_rev.startswith("Not available")
+
+
+def test_awaituntilsettled():
+    vi = init_withoptions("PXI1Slot16", options="Simulate=1,DriverSetup=Model:5654")
+    asyncio.run(ainitiate(vi))
+    asyncio.run(awaituntilsettled(vi))
+    generating = not check_generationstatus(vi)
+    asyncio.run(aabort(vi))
+    done = check_generationstatus(vi)
+    close(vi)
+    assert generating
+    assert done
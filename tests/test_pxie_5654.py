@@ -0,0 +1,53 @@
+"""Test PXIe_5654"""
+import asyncio
+from nirfsg import PXIe_5654
+
+OPTIONS = "Simulate=1,DriverSetup=Model:5654"
+
+# pylint: disable=missing-function-docstring
+def test_batch():
+    with PXIe_5654("PXI1Slot16", driver_options=OPTIONS) as sg:
+        with sg.batch():
+            sg.rf_frequency = 1e9
+            sg.rf_power = -10.0
+            sg.output_enabled = True
+        assert sg.rf_frequency == 1e9
+        assert sg.rf_power == -10.0
+        assert sg.output_enabled
+
+
+def test_batch_reuse_after_raise():
+    with PXIe_5654("PXI1Slot16", driver_options=OPTIONS) as sg:
+        sg.rf_power = -10.0
+        batch = sg.batch()
+        try:
+            with batch:
+                sg.rf_power = 15.0
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        with batch:
+            sg.output_enabled = True
+        assert sg.rf_power == -10.0
+        assert sg.output_enabled
+
+
+def test_dir_unique():
+    with PXIe_5654("PXI1Slot16", driver_options=OPTIONS) as sg:
+        _ = sg.modulation, sg.triggers.start_trigger
+        assert len(dir(sg)) == len(set(dir(sg)))
+        assert len(dir(sg.triggers)) == len(set(dir(sg.triggers)))
+
+
+def test_await_until_settled():
+    async def generate(sg1, sg2):
+        await asyncio.gather(sg1.ainitiate(), sg2.ainitiate())
+        await asyncio.gather(sg1.await_until_settled(), sg2.await_until_settled())
+        generating = not sg1.check_status() and not sg2.check_status()
+        await asyncio.gather(sg1.aabort(), sg2.aabort())
+        return generating
+
+    with PXIe_5654("PXI1Slot16", driver_options=OPTIONS) as sg1:
+        with PXIe_5654("PXI1Slot17", driver_options=OPTIONS) as sg2:
+            assert asyncio.run(generate(sg1, sg2))
+            assert sg1.check_status() and sg2.check_status()